@@ -213,6 +213,42 @@ class WindowManager:
         
         widget.bind('<Enter>', _bind_to_mousewheel)
         widget.bind('<Leave>', _unbind_from_mousewheel)
+    
+    @staticmethod
+    def wrap_in_canvas(parent, content):
+        """Embed an already built content frame in a scrollable canvas"""
+        canvas = tk.Canvas(parent, bg='#f8f9fa', highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        
+        # content is a sibling of the canvas, so raise it above the canvas
+        canvas.create_window((0, 0), window=content, anchor="nw")
+        content.lift(canvas)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # content is fully built by now, so size the scrollregion once from
+        # its requested size and only track later resizes via <Configure>
+        canvas.configure(scrollregion=(0, 0, content.winfo_reqwidth(), content.winfo_reqheight()))
+        
+        # Coalesce bursts of <Configure> (e.g. during a window drag) into a
+        # single scrollregion update once Tk is idle
+        pending = [False]
+        
+        def _apply_scrollregion():
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            pending[0] = False
+        
+        def _on_configure(event):
+            if pending[0]:
+                return
+            pending[0] = True
+            canvas.after_idle(_apply_scrollregion)
+        
+        content.bind("<Configure>", _on_configure)
+        
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        WindowManager.bind_mousewheel(canvas, scrollbar)
+        return canvas
 
 
 class LogManager:
@@ -259,6 +295,9 @@ class LogManager:
 class NavigationManager:
     """Manages sidebar navigation"""
     
+    # Padding around the page shown in the content area
+    PAGE_PADDING = 20
+    
     def __init__(self, parent, content_area, pages):
         self.parent = parent
         self.content_area = content_area
@@ -320,7 +359,7 @@ class NavigationManager:
         
         # Show selected page
         if page_id in self.pages:
-            self.pages[page_id].pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+            self.pages[page_id].pack(fill=tk.BOTH, expand=True, padx=self.PAGE_PADDING, pady=self.PAGE_PADDING)
             self.current_page = page_id
         
         # Update navigation button styles
@@ -210,7 +210,7 @@ def get_month_name(month_number):
     ]
     return month_names[month_number - 1]
 
-def scan_and_organize_images(source_dir):
+def scan_and_organize_images(source_dir, cancel_event=None):
     """
     Scan the source directory recursively for images and organize them by year/month.
     Uses EXIF capture dates when available, otherwise uses the earliest filesystem date.
@@ -218,6 +218,7 @@ def scan_and_organize_images(source_dir):
     
     Args:
         source_dir (Path): Source directory to scan
+        cancel_event (threading.Event): Optional event that stops the scan/move when set
     """
     if not source_dir.exists():
         print(f"Error: Directory '{source_dir}' does not exist.")
@@ -241,6 +242,10 @@ def scan_and_organize_images(source_dir):
     scanned_files = 0
     
     for file_path in source_dir.rglob('*'):
+        if cancel_event is not None and cancel_event.is_set():
+            print("\nImage organization cancelled.")
+            return
+        
         scanned_files += 1
         
         # Show progress every 100 files
@@ -321,6 +326,10 @@ def scan_and_organize_images(source_dir):
             print(f"  {month:02d}-{month_name}/")
             
             for file_info in organized_files[(year, month)]:
+                if cancel_event is not None and cancel_event.is_set():
+                    print("\nImage organization cancelled.")
+                    return
+                
                 source = file_info['source']
                 target = file_info['target']
                 date = file_info['date']
@@ -406,7 +415,7 @@ def scan_and_organize_images(source_dir):
 class ImageOrganizer:
     """Class wrapper for image organization functionality"""
     
-    def __init__(self, directory, mode="check", log_callback=None):
+    def __init__(self, directory, mode="check", log_callback=None, cancel_event=None):
         """
         Initialize the ImageOrganizer
         
@@ -414,10 +423,12 @@ class ImageOrganizer:
             directory (str): Path to the directory containing images to organize
             mode (str): Operation mode - "check", "dry_run", or "move"
             log_callback (callable): Optional callback function for logging (func(message, level))
+            cancel_event (threading.Event): Optional event that stops the run between files when set
         """
         self.directory = Path(directory)
         self.mode = mode
         self.log_callback = log_callback or self._default_log
+        self.cancel_event = cancel_event
     
     def _default_log(self, message, level="INFO"):
         """Default logging function that prints to console"""
@@ -440,7 +451,7 @@ class ImageOrganizer:
             self._scan_and_organize_images_dry_run()
         elif self.mode == "move":
             # For move mode, actually organize the files
-            scan_and_organize_images(self.directory)
+            scan_and_organize_images(self.directory, cancel_event=self.cancel_event)
         else:
             raise ValueError(f"Invalid mode: {self.mode}. Must be 'check', 'dry_run', or 'move'.")
     
@@ -478,6 +489,10 @@ class ImageOrganizer:
         scanned_files = 0
         
         for file_path in self.directory.rglob('*'):
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                self.log_callback("Image organization cancelled", "WARNING")
+                return
+            
             scanned_files += 1
             
             # Show progress every 100 files
@@ -3,11 +3,48 @@ UI Components Module
 Contains reusable UI components and page creators
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime
+from pathlib import Path
 import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from weakref import WeakKeyDictionary
+
+from gui_utils import WindowManager, NavigationManager
+
+
+# File type filters for the single WAV/FLAC file dialog
+_WAV_FILETYPES = (
+    ("Audio Files", "*.wav;*.flac"),
+    ("WAV", "*.wav"),
+    ("FLAC", "*.flac"),
+    ("All Files", "*.*")
+)
+
+# (label, value, tooltip) for the organizer's operation mode radios
+_ORGANIZE_MODES = (
+    ("🔍 Check Only", "check", "Only analyze files and show what would be organized without making any changes"),
+    ("🧪 Dry Run", "dry_run", "Simulate the organization process and show detailed logs without actually moving files"),
+    ("🚀 Actually Move Files", "move", "Actually organize files by moving them to appropriate folders based on their metadata")
+)
+
+# (label, value, tooltip) for the WAV converter's quality radios
+_QUALITY_OPTIONS = (
+    ("🎵 High Quality", "high", "Best quality conversion with maximum compression efficiency"),
+    ("📱 Compatibility Mode", "compatibility", "Optimized for maximum compatibility with older players and devices")
+)
+
+# (label, variable attribute, tooltip) for the WAV converter's metadata checkboxes
+_METADATA_OPTIONS = (
+    ("🔍 Aggressive metadata search", "metadata_var", "Search multiple databases for comprehensive metadata information"),
+    ("🎵 Audio Fingerprinting", "fingerprint_var", "Use audio fingerprinting to identify songs and retrieve metadata")
+)
+
+# Open tooltip window per widget; weak keys so destroyed widgets drop out
+_tooltips = WeakKeyDictionary()
 
 
 class TooltipManager:
@@ -26,17 +63,53 @@ class TooltipManager:
                            font=('Segoe UI', 9), wraplength=300)
             label.pack()
             
-            widget.tooltip = tooltip
+            _tooltips[widget] = tooltip
         
         def hide_tooltip(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+            tooltip = _tooltips.pop(widget, None)
+            if tooltip is not None:
+                tooltip.destroy()
         
         widget.bind('<Enter>', show_tooltip)
         widget.bind('<Leave>', hide_tooltip)
 
 
+def _build_results_card(parent):
+    """Create the per-file results table; Treeview only draws the visible rows"""
+    results_card = ttk.LabelFrame(parent, text="📋 Results", padding=20)
+    results_card.pack(fill=tk.X, pady=(0, 20))
+    
+    tree = ttk.Treeview(results_card, columns=('file', 'status'), show='headings', height=10)
+    tree.heading('file', text="File")
+    tree.heading('status', text="Status")
+    tree.column('status', width=160, stretch=False)
+    tree.configure(displaycolumns=('file', 'status'))
+    
+    scrollbar = ttk.Scrollbar(results_card, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    
+    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    return tree
+
+
+def _place_content(page, content):
+    """Pack a page's content frame, wrapping it in a canvas only if it needs scrolling"""
+    # Called once after all cards are built; until then the content frame is
+    # unmanaged, so the whole page is laid out in this single idle pass
+    page.update_idletasks()
+    # Pages span the full window height less the navigation padding, and the
+    # content sits below the widgets already packed (the title), so content
+    # that fits what's left at the window's minimum height never needs
+    # scrolling; without a minsize, always scroll
+    min_height = page.winfo_toplevel().minsize()[1]
+    available = min_height - 2 * NavigationManager.PAGE_PADDING - page.winfo_reqheight()
+    if content.winfo_reqheight() > available:
+        WindowManager.wrap_in_canvas(page, content)
+    else:
+        content.pack(fill=tk.BOTH, expand=True)
+
+
 class MediaOrganizerPage:
     """Creates the Media Organizer page"""
     
@@ -45,8 +118,24 @@ class MediaOrganizerPage:
         self.log_callback = log_callback
         self.organize_mode_var = tk.StringVar(value="check")
         self.media_dir_var = tk.StringVar()
+        # Worker threads queue log messages and results; _pump forwards them on the Tk thread
+        self._log_q = queue.Queue()
+        self._results_q = queue.Queue()
+        # Set by the Stop button; workers poll it between files
+        self._cancel = threading.Event()
+        # One long-lived worker runs queued jobs, one at a time
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        # Build the widget tree once; create_page hands out the cached frame
+        self._page = self._build_page()
+        self.parent.after(100, self._pump)
     
     def create_page(self):
+        """Return the Media Organizer page (built once in __init__)"""
+        return self._page
+    
+    def _build_page(self):
         """Create the Media Organizer page"""
         page = ttk.Frame(self.parent, style='Content.TFrame')
         
@@ -54,21 +143,12 @@ class MediaOrganizerPage:
         title_label = ttk.Label(page, text="📁 Media Organizer", style='Title.TLabel')
         title_label.pack(pady=(0, 30))
         
-        # Create scrollable content
-        canvas = tk.Canvas(page, bg='#f8f9fa', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(page, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='Content.TFrame')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Cards are packed into a plain frame; a scrolling canvas is only
+        # added if the form turns out taller than the window
+        content = ttk.Frame(page, style='Content.TFrame')
         
         # Directory Selection Card
-        dir_card = ttk.LabelFrame(scrollable_frame, text="📂 Directory Selection", padding=20)
+        dir_card = ttk.LabelFrame(content, text="📂 Directory Selection", padding=20)
         dir_card.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(dir_card, text="📁 Media Directory:", style='Info.TLabel').pack(anchor=tk.W, pady=(0, 10))
@@ -83,35 +163,16 @@ class MediaOrganizerPage:
         browse_btn.pack(side=tk.RIGHT)
         
         # Operation Mode Card
-        mode_card = ttk.LabelFrame(scrollable_frame, text="⚙️ Operation Mode", padding=20)
+        mode_card = ttk.LabelFrame(content, text="⚙️ Operation Mode", padding=20)
         mode_card.pack(fill=tk.X, pady=(0, 20))
         
-        # Check Only option
-        check_frame = ttk.Frame(mode_card)
-        check_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        check_radio = ttk.Radiobutton(check_frame, text="🔍 Check Only", variable=self.organize_mode_var, value="check")
-        check_radio.pack(side=tk.LEFT)
-        TooltipManager.create_tooltip(check_radio, "Only analyze files and show what would be organized without making any changes")
-        
-        # Dry Run option
-        dry_run_frame = ttk.Frame(mode_card)
-        dry_run_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        dry_run_radio = ttk.Radiobutton(dry_run_frame, text="🧪 Dry Run", variable=self.organize_mode_var, value="dry_run")
-        dry_run_radio.pack(side=tk.LEFT)
-        TooltipManager.create_tooltip(dry_run_radio, "Simulate the organization process and show detailed logs without actually moving files")
-        
-        # Actually Move Files option
-        move_frame = ttk.Frame(mode_card)
-        move_frame.pack(fill=tk.X, pady=(0, 0))
-        
-        move_radio = ttk.Radiobutton(move_frame, text="🚀 Actually Move Files", variable=self.organize_mode_var, value="move")
-        move_radio.pack(side=tk.LEFT)
-        TooltipManager.create_tooltip(move_radio, "Actually organize files by moving them to appropriate folders based on their metadata")
+        for text, value, tip in _ORGANIZE_MODES:
+            radio = ttk.Radiobutton(mode_card, text=text, variable=self.organize_mode_var, value=value)
+            radio.pack(anchor=tk.W, pady=(0, 10))
+            TooltipManager.create_tooltip(radio, tip)
         
         # Action Card
-        action_card = ttk.LabelFrame(scrollable_frame, text="🚀 Actions", padding=20)
+        action_card = ttk.LabelFrame(content, text="🚀 Actions", padding=20)
         action_card.pack(fill=tk.X, pady=(0, 20))
         
         self.start_btn = ttk.Button(action_card, text="🚀 Start Organization", command=self.start_organization, style='Success.TButton')
@@ -120,86 +181,129 @@ class MediaOrganizerPage:
         self.stop_btn = ttk.Button(action_card, text="⏹️ Stop", command=self.stop_organization, state=tk.DISABLED, style='Danger.TButton')
         self.stop_btn.pack(side=tk.LEFT)
         
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self._results_tree = _build_results_card(content)
         
-        # Bind mouse wheel to canvas
-        from gui_utils import WindowManager
-        WindowManager.bind_mousewheel(canvas, scrollbar)
+        _place_content(page, content)
         
         return page
     
+    def _tagged_log(self, name):
+        """Build a log_callback for an organizer that prefixes its preformatted messages with name"""
+        def _log(message, level="INFO"):
+            self._safe_log("[%s] %s", name, message, level=level)
+        return _log
+    
+    def _worker_loop(self):
+        """Run queued jobs on the page's worker thread"""
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            finally:
+                self._jobs.task_done()
+    
+    def _safe_log(self, fmt, *args, level="INFO"):
+        """Queue a log message; safe to call from any thread, formatted by _drain"""
+        self._log_q.put((level, fmt, args))
+    
+    def _report_result(self, name, status):
+        """Queue a row for the results table; safe to call from any thread"""
+        self._results_q.put((name, status))
+    
+    def _pump(self):
+        """Forward queued log messages and results to the UI from the Tk main loop"""
+        self._drain()
+        self.parent.after(100, self._pump)
+    
+    def _drain(self):
+        """Flush all queued log messages and result rows"""
+        while True:
+            try:
+                level, fmt, args = self._log_q.get_nowait()
+            except queue.Empty:
+                break
+            self.log_callback(fmt % args if args else fmt, level)
+        while True:
+            try:
+                row = self._results_q.get_nowait()
+            except queue.Empty:
+                break
+            self._results_tree.insert('', 'end', values=row)
+    
+    def _run_dialog(self, dialog, on_result, **options):
+        """Open a native file dialog once the current event and pending UI work are done"""
+        # Tk dialogs must run on the main thread, so rather than blocking
+        # inside the click handler, defer the call and flush the queues first
+        def _open():
+            self._drain()
+            self.parent.update_idletasks()
+            result = dialog(**options)
+            if result:
+                on_result(result)
+        
+        self.parent.after(0, _open)
+    
     def browse_media_directory(self):
         """Browse for media directory"""
-        directory = filedialog.askdirectory(title="Select Media Directory")
-        if directory:
-            self.media_dir_var.set(directory)
+        self._run_dialog(filedialog.askdirectory, self.media_dir_var.set, title="Select Media Directory")
     
     def start_organization(self):
         """Start media organization process"""
-        if not self.media_dir_var.get():
-            self.log_callback("Please select a media directory", "ERROR")
+        # Snapshot the Tk variables here so the worker never touches them
+        mode = self.organize_mode_var.get()
+        directory = self.media_dir_var.get()
+        
+        if not directory:
+            self._safe_log("Please select a media directory", level="ERROR")
             return
         
         # Update button states
         self.start_btn.configure(state=tk.DISABLED)
         self.stop_btn.configure(state=tk.NORMAL)
+        self._cancel.clear()
+        self._results_tree.delete(*self._results_tree.get_children())
         
-        # Start organization in a separate thread
-        self.organization_thread = threading.Thread(target=self.run_organization)
-        self.organization_thread.daemon = True
-        self.organization_thread.start()
+        # Hand the organization to the worker thread
+        self._jobs.put(lambda: self.run_organization(mode, directory))
     
-    def run_organization(self):
+    def run_organization(self, mode, directory):
         """Run the media organization process"""
         try:
-            mode = self.organize_mode_var.get()
-            directory = self.media_dir_var.get()
+            self._safe_log("Starting media organization in %s mode", mode)
             
-            self.log_callback(f"Starting media organization in {mode} mode", "INFO")
+            from image_organizer import ImageOrganizer
+            from video_organizer import VideoOrganizer
             
-            # Import and run the appropriate organizer
-            if mode == "check":
-                from image_organizer import ImageOrganizer
-                from video_organizer import VideoOrganizer
-                
-                # Check images
-                img_organizer = ImageOrganizer(directory, mode="check", log_callback=self.log_callback)
-                img_organizer.organize_images()
-                
-                # Check videos
-                vid_organizer = VideoOrganizer(directory, mode="check", log_callback=self.log_callback)
-                vid_organizer.organize_videos()
-                
-            elif mode == "dry_run":
-                from image_organizer import ImageOrganizer
-                from video_organizer import VideoOrganizer
-                
-                # Dry run images
-                img_organizer = ImageOrganizer(directory, mode="dry_run", log_callback=self.log_callback)
-                img_organizer.organize_images()
-                
-                # Dry run videos
-                vid_organizer = VideoOrganizer(directory, mode="dry_run", log_callback=self.log_callback)
-                vid_organizer.organize_videos()
-                
-            elif mode == "move":
-                from image_organizer import ImageOrganizer
-                from video_organizer import VideoOrganizer
-                
-                # Actually organize images
-                img_organizer = ImageOrganizer(directory, mode="move", log_callback=self.log_callback)
-                img_organizer.organize_images()
-                
-                # Actually organize videos
-                vid_organizer = VideoOrganizer(directory, mode="move", log_callback=self.log_callback)
-                vid_organizer.organize_videos()
+            # Both passes stream into the same log, so tag each line with its pass
+            img_organizer = ImageOrganizer(directory, mode=mode, log_callback=self._tagged_log("Images"), cancel_event=self._cancel)
+            vid_organizer = VideoOrganizer(directory, mode=mode, log_callback=self._tagged_log("Videos"), cancel_event=self._cancel)
             
-            self.log_callback("Media organization completed successfully", "SUCCESS")
+            # Images and videos are disjoint file sets and both passes are
+            # IO-bound, so run them side by side
+            failed = []
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    ("Images", executor.submit(img_organizer.organize_images)),
+                    ("Videos", executor.submit(vid_organizer.organize_videos))
+                ]
+                for name, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self._report_result(name, f"Failed: {e}")
+                        failed.append(f"{name}: {e}")
+                        continue
+                    self._report_result(name, "Stopped" if self._cancel.is_set() else "Done")
+            
+            if failed:
+                self._safe_log("Media organization failed: %s", "; ".join(failed), level="ERROR")
+            elif self._cancel.is_set():
+                self._safe_log("Media organization stopped", level="WARNING")
+            else:
+                self._safe_log("Media organization completed successfully", level="SUCCESS")
             
         except Exception as e:
-            self.log_callback(f"Media organization failed: {str(e)}", "ERROR")
+            self._safe_log("Media organization failed: %s", e, level="ERROR")
         finally:
             # Update button states
             self.parent.after(0, lambda: self.start_btn.configure(state=tk.NORMAL))
@@ -207,9 +311,9 @@ class MediaOrganizerPage:
     
     def stop_organization(self):
         """Stop media organization process"""
-        self.log_callback("Media organization stop requested", "WARNING")
-        # Update button states
-        self.start_btn.configure(state=tk.NORMAL)
+        self._safe_log("Media organization stop requested", level="WARNING")
+        self._cancel.set()
+        # Start is re-enabled by run_organization once the worker has stopped
         self.stop_btn.configure(state=tk.DISABLED)
 
 
@@ -229,8 +333,24 @@ class WAVConverterPage:
         self.quality_var = tk.StringVar(value="high")
         self.metadata_var = tk.BooleanVar(value=True)
         self.fingerprint_var = tk.BooleanVar(value=False)
+        # Worker threads queue log messages and results; _pump forwards them on the Tk thread
+        self._log_q = queue.Queue()
+        self._results_q = queue.Queue()
+        # Set by the Stop button; workers poll it between files
+        self._cancel = threading.Event()
+        # One long-lived worker runs queued jobs, one at a time
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        # Build the widget tree once; create_page hands out the cached frame
+        self._page = self._build_page()
+        self.parent.after(100, self._pump)
     
     def create_page(self):
+        """Return the WAV to FLAC Converter page (built once in __init__)"""
+        return self._page
+    
+    def _build_page(self):
         """Create the WAV to FLAC Converter page"""
         page = ttk.Frame(self.parent, style='Content.TFrame')
         
@@ -238,21 +358,12 @@ class WAVConverterPage:
         title_label = ttk.Label(page, text="🎵 WAV to FLAC Converter", style='Title.TLabel')
         title_label.pack(pady=(0, 30))
         
-        # Create scrollable content
-        canvas = tk.Canvas(page, bg='#f8f9fa', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(page, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='Content.TFrame')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Cards are packed into a plain frame; a scrolling canvas is only
+        # added if the form turns out taller than the window
+        content = ttk.Frame(page, style='Content.TFrame')
         
         # Mode & Source Selection Card
-        dir_card = ttk.LabelFrame(scrollable_frame, text="📂 Source Selection", padding=20)
+        dir_card = ttk.LabelFrame(content, text="📂 Source Selection", padding=20)
         dir_card.pack(fill=tk.X, pady=(0, 20))
         
         # Mode toggle (Directory vs Single File)
@@ -288,7 +399,7 @@ class WAVConverterPage:
         self.file_browse_btn.pack(side=tk.RIGHT)
         
         # Output Directory Card
-        out_card = ttk.LabelFrame(scrollable_frame, text="📤 Output Directory", padding=20)
+        out_card = ttk.LabelFrame(content, text="📤 Output Directory", padding=20)
         out_card.pack(fill=tk.X, pady=(0, 20))
         
         out_label = ttk.Label(out_card, text="📁 Target Directory:", style='Info.TLabel')
@@ -304,47 +415,25 @@ class WAVConverterPage:
         out_browse_btn.pack(side=tk.RIGHT)
 
         # Quality Settings Card
-        quality_card = ttk.LabelFrame(scrollable_frame, text="⚙️ Quality Settings", padding=20)
+        quality_card = ttk.LabelFrame(content, text="⚙️ Quality Settings", padding=20)
         quality_card.pack(fill=tk.X, pady=(0, 20))
         
-        # High Quality option
-        high_frame = ttk.Frame(quality_card)
-        high_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        high_radio = ttk.Radiobutton(high_frame, text="🎵 High Quality", variable=self.quality_var, value="high")
-        high_radio.pack(side=tk.LEFT)
-        TooltipManager.create_tooltip(high_radio, "Best quality conversion with maximum compression efficiency")
-        
-        # Compatibility Mode option
-        compat_frame = ttk.Frame(quality_card)
-        compat_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        compat_radio = ttk.Radiobutton(compat_frame, text="📱 Compatibility Mode", variable=self.quality_var, value="compatibility")
-        compat_radio.pack(side=tk.LEFT)
-        TooltipManager.create_tooltip(compat_radio, "Optimized for maximum compatibility with older players and devices")
+        for text, value, tip in _QUALITY_OPTIONS:
+            radio = ttk.Radiobutton(quality_card, text=text, variable=self.quality_var, value=value)
+            radio.pack(anchor=tk.W, pady=(0, 10))
+            TooltipManager.create_tooltip(radio, tip)
         
         # Metadata Options Card
-        metadata_card = ttk.LabelFrame(scrollable_frame, text="🏷️ Metadata Options", padding=20)
+        metadata_card = ttk.LabelFrame(content, text="🏷️ Metadata Options", padding=20)
         metadata_card.pack(fill=tk.X, pady=(0, 20))
         
-        # Aggressive metadata search
-        aggressive_frame = ttk.Frame(metadata_card)
-        aggressive_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        aggressive_check = ttk.Checkbutton(aggressive_frame, text="🔍 Aggressive metadata search", variable=self.metadata_var)
-        aggressive_check.pack(side=tk.LEFT)
-        TooltipManager.create_tooltip(aggressive_check, "Search multiple databases for comprehensive metadata information")
-        
-        # Audio Fingerprinting
-        fingerprint_frame = ttk.Frame(metadata_card)
-        fingerprint_frame.pack(fill=tk.X, pady=(0, 0))
-        
-        fingerprint_check = ttk.Checkbutton(fingerprint_frame, text="🎵 Audio Fingerprinting", variable=self.fingerprint_var)
-        fingerprint_check.pack(side=tk.LEFT)
-        TooltipManager.create_tooltip(fingerprint_check, "Use audio fingerprinting to identify songs and retrieve metadata")
+        for text, var_name, tip in _METADATA_OPTIONS:
+            check = ttk.Checkbutton(metadata_card, text=text, variable=getattr(self, var_name))
+            check.pack(anchor=tk.W, pady=(0, 10))
+            TooltipManager.create_tooltip(check, tip)
         
         # Action Card
-        action_card = ttk.LabelFrame(scrollable_frame, text="🚀 Actions", padding=20)
+        action_card = ttk.LabelFrame(content, text="🚀 Actions", padding=20)
         action_card.pack(fill=tk.X, pady=(0, 20))
         
         self.start_btn = ttk.Button(action_card, text="🚀 Start Conversion", command=self.start_conversion, style='Success.TButton')
@@ -353,59 +442,109 @@ class WAVConverterPage:
         self.stop_btn = ttk.Button(action_card, text="⏹️ Stop", command=self.stop_conversion, state=tk.DISABLED, style='Danger.TButton')
         self.stop_btn.pack(side=tk.LEFT)
         
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Bind mouse wheel to canvas
-        from gui_utils import WindowManager
-        WindowManager.bind_mousewheel(canvas, scrollbar)
+        self._results_tree = _build_results_card(content)
         
         # Initial visibility for source inputs (toggle frames/labels, not inner widgets)
         self._dir_widgets = [dir_label, dir_frame]
         self._file_widgets = [self.file_label, self.file_frame]
         self._update_source_visibility()
 
+        _place_content(page, content)
+
         return page
     
+    def _worker_loop(self):
+        """Run queued jobs on the page's worker thread"""
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            finally:
+                self._jobs.task_done()
+    
+    def _safe_log(self, fmt, *args, level="INFO"):
+        """Queue a log message; safe to call from any thread, formatted by _drain"""
+        self._log_q.put((level, fmt, args))
+    
+    def _report_result(self, name, status):
+        """Queue a row for the results table; safe to call from any thread"""
+        self._results_q.put((name, status))
+    
+    def _pump(self):
+        """Forward queued log messages and results to the UI from the Tk main loop"""
+        self._drain()
+        self.parent.after(100, self._pump)
+    
+    def _drain(self):
+        """Flush all queued log messages and result rows"""
+        while True:
+            try:
+                level, fmt, args = self._log_q.get_nowait()
+            except queue.Empty:
+                break
+            self.log_callback(fmt % args if args else fmt, level)
+        while True:
+            try:
+                row = self._results_q.get_nowait()
+            except queue.Empty:
+                break
+            self._results_tree.insert('', 'end', values=row)
+    
+    def _run_dialog(self, dialog, on_result, **options):
+        """Open a native file dialog once the current event and pending UI work are done"""
+        # Tk dialogs must run on the main thread, so rather than blocking
+        # inside the click handler, defer the call and flush the queues first
+        def _open():
+            self._drain()
+            self.parent.update_idletasks()
+            result = dialog(**options)
+            if result:
+                on_result(result)
+        
+        self.parent.after(0, _open)
+    
     def browse_wav_directory(self):
         """Browse for WAV directory"""
-        directory = filedialog.askdirectory(title="Select WAV/FLAC Directory")
-        if directory:
-            self.wav_dir_var.set(directory)
-            # Default output to the same folder unless user chose a custom one
-            if self._auto_output or not self.output_dir_var.get() or self.output_dir_var.get() == self._last_input_based_output:
+        self._run_dialog(filedialog.askdirectory, self._on_wav_directory_selected, title="Select WAV/FLAC Directory")
+    
+    def _on_wav_directory_selected(self, directory):
+        """Apply a directory picked in browse_wav_directory"""
+        self.wav_dir_var.set(directory)
+        # Default output to the same folder unless user chose a custom one
+        current_output = self.output_dir_var.get()
+        if self._auto_output or not current_output or current_output == self._last_input_based_output:
+            # Skip the Tcl round-trip (and any traces) when nothing changes
+            if current_output != directory:
                 self.output_dir_var.set(directory)
-                self._last_input_based_output = directory
+            self._last_input_based_output = directory
     
     def browse_wav_file(self):
         """Browse for a single WAV/FLAC file"""
-        filetypes = [
-            ("Audio Files", "*.wav;*.flac"),
-            ("WAV", "*.wav"),
-            ("FLAC", "*.flac"),
-            ("All Files", "*.*")
-        ]
-        file_path = filedialog.askopenfilename(title="Select WAV/FLAC File", filetypes=filetypes)
-        if file_path:
-            self.wav_file_var.set(file_path)
-            # Default output to the file's folder unless user chose a custom one
-            try:
-                import os
-                parent_dir = os.path.dirname(file_path)
-                if self._auto_output or not self.output_dir_var.get() or self.output_dir_var.get() == self._last_input_based_output:
+        self._run_dialog(filedialog.askopenfilename, self._on_wav_file_selected, title="Select WAV/FLAC File", filetypes=_WAV_FILETYPES)
+    
+    def _on_wav_file_selected(self, file_path):
+        """Apply a file picked in browse_wav_file"""
+        self.wav_file_var.set(file_path)
+        # Default output to the file's folder unless user chose a custom one
+        try:
+            parent_dir = os.path.dirname(file_path)
+            current_output = self.output_dir_var.get()
+            if self._auto_output or not current_output or current_output == self._last_input_based_output:
+                if current_output != parent_dir:
                     self.output_dir_var.set(parent_dir)
-                    self._last_input_based_output = parent_dir
-            except Exception:
-                pass
+                self._last_input_based_output = parent_dir
+        except Exception:
+            pass
     
     def browse_output_directory(self):
         """Browse for output directory"""
-        directory = filedialog.askdirectory(title="Select Output Directory")
-        if directory:
-            self.output_dir_var.set(directory)
-            # User explicitly selected output, stop auto-updating
-            self._auto_output = False
+        self._run_dialog(filedialog.askdirectory, self._on_output_directory_selected, title="Select Output Directory")
+    
+    def _on_output_directory_selected(self, directory):
+        """Apply a directory picked in browse_output_directory"""
+        self.output_dir_var.set(directory)
+        # User explicitly selected output, stop auto-updating
+        self._auto_output = False
     
     def _update_source_visibility(self):
         """Toggle visibility of directory vs file inputs based on mode"""
@@ -431,42 +570,43 @@ class WAVConverterPage:
     
     def start_conversion(self):
         """Start WAV to FLAC conversion process"""
-        mode = self.input_mode_var.get()
-        
-        if mode == "directory" and not self.wav_dir_var.get():
-            self.log_callback("Please select a WAV/FLAC directory", "ERROR")
+        # Snapshot the Tk variables here so the worker never touches them
+        settings = {
+            'mode': self.input_mode_var.get(),
+            'directory': self.wav_dir_var.get(),
+            'single_file': self.wav_file_var.get(),
+            'output_dir': self.output_dir_var.get(),
+            'quality': self.quality_var.get(),
+            'metadata': self.metadata_var.get(),
+            'fingerprint': self.fingerprint_var.get()
+        }
+        mode = settings['mode']
+        
+        if mode == "directory" and not settings['directory']:
+            self._safe_log("Please select a WAV/FLAC directory", level="ERROR")
             return
-        elif mode == "single" and not self.wav_file_var.get():
-            self.log_callback("Please select a WAV/FLAC file", "ERROR")
+        elif mode == "single" and not settings['single_file']:
+            self._safe_log("Please select a WAV/FLAC file", level="ERROR")
             return
         
         # Validate output directory
-        output_dir = self.output_dir_var.get()
-        if not output_dir:
-            self.log_callback("Please select an output directory", "ERROR")
+        if not settings['output_dir']:
+            self._safe_log("Please select an output directory", level="ERROR")
             return
         
         # Update button states
         self.start_btn.configure(state=tk.DISABLED)
         self.stop_btn.configure(state=tk.NORMAL)
+        self._cancel.clear()
+        self._results_tree.delete(*self._results_tree.get_children())
         
-        # Start conversion in a separate thread
-        self.conversion_thread = threading.Thread(target=self.run_conversion)
-        self.conversion_thread.daemon = True
-        self.conversion_thread.start()
+        # Hand the conversion to the worker thread
+        self._jobs.put(lambda: self.run_conversion(**settings))
     
-    def run_conversion(self):
+    def run_conversion(self, mode, directory, single_file, output_dir, quality, metadata, fingerprint):
         """Run the WAV to FLAC conversion process"""
         try:
-            mode = self.input_mode_var.get()
-            directory = self.wav_dir_var.get()
-            single_file = self.wav_file_var.get()
-            output_dir = self.output_dir_var.get()
-            quality = self.quality_var.get()
-            metadata = self.metadata_var.get()
-            fingerprint = self.fingerprint_var.get()
-            
-            self.log_callback(f"Starting WAV to FLAC conversion in {quality} mode", "INFO")
+            self._safe_log("Starting WAV to FLAC conversion in %s mode", quality)
             
             # Use enhanced converter (directory or single file)
             from wav_to_flac_converter import EnhancedWAVToFLACConverter
@@ -474,13 +614,12 @@ class WAVConverterPage:
             # Decide source path for converter
             if mode == "single":
                 if not single_file:
-                    self.log_callback("Please select a WAV/FLAC file", "ERROR")
+                    self._safe_log("Please select a WAV/FLAC file", level="ERROR")
                     return
-                import os
                 source_path = os.path.dirname(single_file)
             else:
                 if not directory:
-                    self.log_callback("Please select a WAV/FLAC directory", "ERROR")
+                    self._safe_log("Please select a WAV/FLAC directory", level="ERROR")
                     return
                 source_path = directory
             
@@ -490,21 +629,26 @@ class WAVConverterPage:
                 compatibility_mode=(quality == "compatibility"),
                 enable_metadata=metadata,
                 aggressive_metadata=metadata,
-                enable_fingerprinting=fingerprint
+                enable_fingerprinting=fingerprint,
+                cancel_event=self._cancel
             )
             
             if mode == "single":
-                from pathlib import Path
                 success = converter.process_single_file(Path(single_file))
+                self._report_result(Path(single_file).name, "Converted" if success else "Failed")
                 if not success:
                     raise RuntimeError("Single file conversion failed")
             else:
-                converter.convert_all()
+                converted, failed = converter.convert_all()
+                self._report_result(source_path, f"{converted} converted, {failed} failed")
             
-            self.log_callback("WAV to FLAC conversion completed successfully", "SUCCESS")
+            if self._cancel.is_set():
+                self._safe_log("WAV to FLAC conversion stopped", level="WARNING")
+            else:
+                self._safe_log("WAV to FLAC conversion completed successfully", level="SUCCESS")
             
         except Exception as e:
-            self.log_callback(f"WAV to FLAC conversion failed: {str(e)}", "ERROR")
+            self._safe_log("WAV to FLAC conversion failed: %s", e, level="ERROR")
         finally:
             # Update button states
             self.parent.after(0, lambda: self.start_btn.configure(state=tk.NORMAL))
@@ -512,7 +656,7 @@ class WAVConverterPage:
     
     def stop_conversion(self):
         """Stop WAV to FLAC conversion process"""
-        self.log_callback("WAV to FLAC conversion stop requested", "WARNING")
-        # Update button states
-        self.start_btn.configure(state=tk.NORMAL)
+        self._safe_log("WAV to FLAC conversion stop requested", level="WARNING")
+        self._cancel.set()
+        # Start is re-enabled by run_conversion once the worker has stopped
         self.stop_btn.configure(state=tk.DISABLED)
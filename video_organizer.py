@@ -11,97 +11,579 @@ import os
 import sys
 import argparse
 import shutil
-from datetime import datetime
+import sqlite3
+import struct
+import threading
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-import mimetypes
+from stat import S_ISDIR
 import subprocess
 import json
 
-# Try to import ffprobe for video metadata extraction
+# Try to import PyAV, which probes files in-process through libavformat
 try:
-    import ffmpeg
-    FFMPEG_AVAILABLE = True
+    import av
+    AV_AVAILABLE = True
 except ImportError:
-    FFMPEG_AVAILABLE = False
-    print("Warning: ffmpeg-python library not found. Install it with: pip install ffmpeg-python")
-    print("Will fall back to file system dates for videos without metadata.")
+    AV_AVAILABLE = False
+
+# Locate ffprobe for video metadata extraction
+FFPROBE_PATH = shutil.which('ffprobe')
+if FFPROBE_PATH is None and not AV_AVAILABLE:
+    print("Warning: ffprobe not found in PATH. Install FFmpeg to read video metadata.")
+    print("Only MP4/MOV creation dates will be read; other videos will be skipped.")
 
 # Common video file extensions
-VIDEO_EXTENSIONS = {
+VIDEO_EXTENSIONS = frozenset({
     '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp',
     '.ogv', '.ts', '.mts', '.m2ts', '.vob', '.asf', '.rm', '.rmvb', '.divx',
     '.xvid', '.mpg', '.mpeg', '.m2v', '.m4v', '.f4v', '.f4p', '.f4a', '.f4b'
-}
+})
+
+# An unorganized video: where it is, where it belongs, and what the report
+# shows about it (duration and size may be None)
+VideoFileInfo = namedtuple('VideoFileInfo', ['source', 'target', 'date', 'duration', 'size'])
+
+# Default number of concurrent metadata probes
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Upper bound on concurrent moves; cross-device copies compete for the
+# same disks, so more threads than this only add seeking
+MAX_MOVE_JOBS = 8
+
+# ISO base media containers whose creation time can be read straight from the 'mvhd' box
+MP4_EXTENSIONS = {'.mp4', '.mov', '.m4v', '.3gp', '.f4v'}
+
+# Metadata tags that may hold a video's creation date, in order of preference
+_DATE_FIELDS = (
+    'creation_time', 'date', 'date_created', 'creation_date',
+    'creation_time_utc', 'date_time', 'date_time_original'
+)
+
+# strptime formats tried when a date tag is not ISO 8601
+_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y:%m:%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%Y/%m/%d %H:%M:%S"
+)
+
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# The only ffprobe fields we read: duration, size and the date tags
+_FFPROBE_ENTRIES = 'format=duration,size:format_tags=' + ','.join(_DATE_FIELDS)
+
+# Folder names created by the organizer, "01-January" .. "12-December"
+_MONTH_DIRS = tuple(f"{i + 1:02d}-{name}" for i, name in enumerate(_MONTH_NAMES))
 
-def is_video_file(file_path):
+# MP4/QuickTime timestamps count seconds from this date (UTC)
+_MP4_EPOCH = datetime(1904, 1, 1)
+
+def is_video_file(file_name):
     """
-    Check if a file is a video based on its extension and MIME type.
+    Check if a file is a video based on its extension.
     
     Args:
-        file_path (Path): Path to the file to check
+        file_name (str or Path): Name or path of the file to check
         
     Returns:
         bool: True if the file is a video, False otherwise
     """
-    # Check by extension first (faster)
-    if file_path.suffix.lower() in VIDEO_EXTENSIONS:
-        return True
+    # Plain string slicing; no Path object or splitext call per entry
+    name = os.fspath(file_name)
+    return name[name.rfind('.'):].lower() in VIDEO_EXTENSIONS
+
+def is_video_mime(file_name):
+    """
+    Check if a file name maps to a video/* MIME type.
+    
+    mimetypes is imported (and its system database read) on first use
+    only, since the extension check covers the formats we expect.
     
-    # Fallback to MIME type check
-    mime_type, _ = mimetypes.guess_type(str(file_path))
+    Args:
+        file_name (str): Name or path of the file to check
+        
+    Returns:
+        bool: True if the guessed MIME type is a video type, False otherwise
+    """
+    import mimetypes
+    mime_type, _ = mimetypes.guess_type(file_name)
     return mime_type is not None and mime_type.startswith('video/')
 
-def get_video_metadata(video_path):
+def _user_cache_dir():
+    """
+    Get the per-user cache directory for this tool.
+    
+    Returns:
+        Path: %LOCALAPPDATA% on Windows, ~/Library/Caches on macOS and
+            $XDG_CACHE_HOME (or ~/.cache) elsewhere, plus an app subfolder
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return Path(base) / "MediaConverter-Organizer"
+
+class _ProbeError(Exception):
+    """A video could not be probed, as opposed to having no creation date"""
+
+class _MetaCache:
+    """
+    On-disk cache of probed video metadata in the user's cache directory.
+    
+    Rows are keyed by absolute path and only trusted while the file's mtime
+    and size are unchanged, so re-running the organizer skips ffprobe for
+    every file that has not been modified since the last scan. Nothing is
+    written into the scanned media folder. Writes are committed in batches
+    so the database is never locked for a whole scan, and any database
+    error (locked, corrupt, disk full) just disables the cache for the run.
+    """
+    
+    FILENAME = "video_metadata.db"
+    BATCH_SIZE = 500
+    
+    def __init__(self, db_path=None, log=None):
+        self._lock = threading.Lock()
+        self._log = log
+        self._pending = 0
+        try:
+            if db_path is None:
+                cache_dir = _user_cache_dir()
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                db_path = cache_dir / self.FILENAME
+            # Probes run on worker threads, so share one connection behind a lock
+            self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            # WAL appends instead of rewriting pages through a rollback journal
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+                "creation_date TEXT, duration REAL)"
+            )
+        except (OSError, sqlite3.Error):
+            # No writable cache directory - just run without the cache
+            self.conn = None
+    
+    def _disable(self, error):
+        """Drop the connection after a database error; called with _lock held"""
+        message = f"Warning: metadata cache disabled: {error}"
+        if self._log is None:
+            print(message)
+        else:
+            self._log(message, "WARNING")
+        try:
+            self.conn.close()
+        except sqlite3.Error:
+            pass
+        self.conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def get(self, path, stat):
+        """
+        Look up cached metadata for a file.
+        
+        Args:
+            path (str): Path to the video file
+            stat (os.stat_result): Current stat of the file
+            
+        Returns:
+            tuple: (hit, metadata) - hit is False when the file must be probed
+        """
+        with self._lock:
+            # close() may run concurrently when a scan is cancelled
+            if self.conn is None:
+                return False, None
+            try:
+                row = self.conn.execute(
+                    "SELECT mtime, size, creation_date, duration FROM metadata WHERE path = ?",
+                    (os.path.abspath(path),)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return False, None
+        if row is None or row[0] != stat.st_mtime or row[1] != stat.st_size:
+            return False, None
+        
+        mtime, size, creation_date, duration = row
+        if creation_date is None and duration is None:
+            return True, None
+        metadata = {'size': size}
+        if creation_date is not None:
+            metadata['creation_date'] = datetime.fromisoformat(creation_date)
+        if duration is not None:
+            metadata['duration'] = duration
+        return True, metadata
+    
+    def put(self, path, stat, metadata):
+        """Store probed metadata (or its absence) for a file"""
+        metadata = metadata or {}
+        creation_date = metadata.get('creation_date')
+        with self._lock:
+            if self.conn is None:
+                return
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                    (os.path.abspath(path), stat.st_mtime, stat.st_size,
+                     creation_date.isoformat() if creation_date else None,
+                     metadata.get('duration'))
+                )
+                self._pending += 1
+                # Commit in batches to amortize fsync without holding the
+                # write lock against other runs for the whole scan
+                if self._pending >= self.BATCH_SIZE:
+                    self.conn.commit()
+                    self._pending = 0
+            except sqlite3.Error as e:
+                self._disable(e)
+    
+    def close(self):
+        """Commit outstanding rows and close the database"""
+        with self._lock:
+            if self.conn is None:
+                return
+            try:
+                self.conn.commit()
+                self.conn.close()
+            except sqlite3.Error as e:
+                self._disable(e)
+            self.conn = None
+
+def iter_videos(root, strict_mime=False):
+    """
+    Recursively yield the video files below a directory.
+    
+    Uses os.scandir, whose DirEntry objects already carry the file type
+    (and cache stat results), instead of building and stat-ing a Path for
+    every entry as Path.rglob does.
+    
+    Args:
+        root (Path or str): Directory to walk
+        strict_mime (bool): If True, also yield files with an unknown extension
+            whose MIME type is video/*
+        
+    Yields:
+        os.DirEntry: Entry for each video file found
+    """
+    if strict_mime:
+        # Load the MIME tables before the walk rather than on the first miss
+        import mimetypes
+        mimetypes.init()
+    
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        if is_video_file(entry.name):
+                            yield entry
+                        elif strict_mime and is_video_mime(entry.name):
+                            yield entry
+        except OSError:
+            # Unreadable directory - skip it like rglob would
+            continue
+
+def get_video_metadata(video_path, cache=None, stat=None):
     """
     Extract metadata from a video file using ffprobe.
     
+    With a cache, results are reused (within a scan and across runs) for
+    files whose mtime and size have not changed; a modified file is always
+    probed again, and so is a file whose last probe failed.
+    
     Args:
         video_path (Path): Path to the video file
+        cache (_MetaCache): Optional on-disk metadata cache
+        stat (os.stat_result): The file's stat if already known (e.g. from a DirEntry)
         
     Returns:
         dict or None: Video metadata including creation date, or None if not found
     """
-    if not FFMPEG_AVAILABLE:
-        return None
+    path = str(video_path)
+    if cache is None:
+        return _probe_video_metadata(path)
+    
+    if stat is None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return _probe_video_metadata(path)
     
+    hit, metadata = cache.get(path, stat)
+    if hit:
+        return metadata
     try:
-        # Use ffprobe to get video metadata
-        probe = ffmpeg.probe(str(video_path))
+        metadata = _read_video_metadata(path)
+    except _ProbeError:
+        # Timeouts and prober errors may be transient; don't record them
+        return None
+    cache.put(path, stat, metadata)
+    return metadata
+
+def _find_mp4_box(f, start, end, box_type):
+    """
+    Find the first box of a given type between two offsets of an MP4 file.
+    
+    Only box headers are read; everything else is skipped with a seek.
+    
+    Args:
+        f (file): File opened in binary mode
+        start (int): Offset of the first box header
+        end (int): Offset where the enclosing box (or the file) ends
+        box_type (bytes): Four-character box type, e.g. b'moov'
         
-        if not probe or 'format' not in probe:
+    Returns:
+        tuple or None: (payload_start, payload_end) offsets, or None if not found
+    """
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        size, kind = struct.unpack('>I4s', header)
+        header_size = 8
+        if size == 1:
+            # 64-bit box size follows the type
+            large_size = f.read(8)
+            if len(large_size) < 8:
+                return None
+            size = struct.unpack('>Q', large_size)[0]
+            header_size = 16
+        elif size == 0:
+            # Box extends to the end of its container
+            size = end - offset
+        if size < header_size:
             return None
+        if kind == box_type:
+            return offset + header_size, offset + size
+        offset += size
+    return None
+
+def _mp4_creation_time(video_path):
+    """
+    Read the creation time and duration from an MP4/MOV 'moov/mvhd' box.
+    
+    This avoids spawning ffprobe for the common MP4/MOV case: only a few
+    box headers and the small mvhd payload are read from the file.
+    
+    Args:
+        video_path (str): Path to the video file
         
+    Returns:
+        tuple or None: (creation_date, duration_seconds), or None if no creation time is set
+    """
+    try:
+        with open(video_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            moov = _find_mp4_box(f, 0, file_size, b'moov')
+            if moov is None:
+                return None
+            mvhd = _find_mp4_box(f, moov[0], moov[1], b'mvhd')
+            if mvhd is None:
+                return None
+            
+            f.seek(mvhd[0])
+            version = f.read(4)[0]
+            if version == 1:
+                creation, _, timescale, duration = struct.unpack('>QQIQ', f.read(28))
+            else:
+                creation, _, timescale, duration = struct.unpack('>IIII', f.read(16))
+    except (OSError, IndexError, struct.error):
+        return None
+    
+    if creation == 0:
+        # Creation time not set - let ffprobe look at the other tags
+        return None
+    
+    try:
+        creation_date = _MP4_EPOCH + timedelta(seconds=creation)
+    except OverflowError:
+        return None
+    return creation_date, (duration / timescale if timescale else None)
+
+def _parse_date(date_str):
+    """
+    Parse a metadata date string.
+    
+    ffprobe almost always reports ISO 8601, which fromisoformat parses in
+    C without raising; the strptime formats are only tried on a miss.
+    
+    Args:
+        date_str (str): Date value of a metadata tag
+        
+    Returns:
+        datetime or None: Naive UTC datetime, or None if no format matches
+    """
+    try:
+        parsed = datetime.fromisoformat(date_str[:-1] + '+00:00' if date_str.endswith('Z') else date_str)
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    except ValueError:
+        pass
+    
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
+def _creation_date_from_tags(tags):
+    """
+    Parse the first usable creation date out of container metadata tags.
+    
+    Args:
+        tags (dict): Container-level metadata tags
+        
+    Returns:
+        datetime or None: Naive UTC creation date, or None if no tag parses
+    """
+    for field in _DATE_FIELDS:
+        date_str = tags.get(field)
+        if date_str and isinstance(date_str, str):
+            creation_date = _parse_date(date_str)
+            if creation_date is not None:
+                return creation_date
+    return None
+
+def _av_probe(video_path):
+    """
+    Read creation date, duration and size with PyAV.
+    
+    libavformat runs in-process, so there is no ffprobe subprocess to
+    fork and no JSON to decode per file.
+    
+    Args:
+        video_path (str): Path to the video file
+        
+    Returns:
+        dict or None: Video metadata including creation date, or None if not found
+        
+    Raises:
+        _ProbeError: If PyAV cannot read the file
+    """
+    try:
+        container = av.open(video_path, metadata_errors='ignore')
+    except Exception as e:
+        raise _ProbeError(e) from e
+    
+    try:
+        metadata = {}
+        creation_date = _creation_date_from_tags(container.metadata)
+        if creation_date is not None:
+            metadata['creation_date'] = creation_date
+        
+        if container.duration is not None:
+            metadata['duration'] = container.duration / av.time_base
+        
+        try:
+            metadata['size'] = os.path.getsize(video_path)
+        except OSError:
+            pass
+        
+        return metadata if metadata else None
+    except Exception as e:
+        raise _ProbeError(e) from e
+    finally:
+        container.close()
+
+def _probe_video_metadata(video_path):
+    """
+    Extract the metadata we use from a video file, treating probe errors as no metadata.
+    
+    Args:
+        video_path (str): Path to the video file
+        
+    Returns:
+        dict or None: Video metadata including creation date, or None if not found
+    """
+    try:
+        return _read_video_metadata(video_path)
+    except _ProbeError:
+        # Will fall back to file system date
+        return None
+
+def _read_video_metadata(video_path):
+    """
+    Extract the metadata we use from a video file.
+    
+    MP4/MOV files are read directly; other containers (and MP4s without
+    a creation time) are opened with PyAV when installed, else ffprobe.
+    
+    Args:
+        video_path (str): Path to the video file
+        
+    Returns:
+        dict or None: Video metadata including creation date, or None if
+            the file was read but has none
+        
+    Raises:
+        _ProbeError: If no prober is available or probing the file failed
+    """
+    if os.path.splitext(video_path)[1].lower() in MP4_EXTENSIONS:
+        mvhd = _mp4_creation_time(video_path)
+        if mvhd is not None:
+            creation_date, duration = mvhd
+            metadata = {'creation_date': creation_date}
+            if duration is not None:
+                metadata['duration'] = duration
+            try:
+                metadata['size'] = os.path.getsize(video_path)
+            except OSError:
+                pass
+            return metadata
+    
+    if AV_AVAILABLE:
+        return _av_probe(video_path)
+    
+    if FFPROBE_PATH is None:
+        raise _ProbeError("no metadata prober available")
+    
+    try:
+        # Ask ffprobe for just the fields we use rather than the whole
+        # format/stream tree
+        result = subprocess.run(
+            [FFPROBE_PATH, '-v', 'quiet', '-show_entries', _FFPROBE_ENTRIES, '-of', 'json', video_path],
+            capture_output=True, text=True, timeout=10
+        )
+        if result.returncode != 0:
+            raise _ProbeError(f"ffprobe exited with status {result.returncode}")
+        probe = json.loads(result.stdout)
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        raise _ProbeError(e) from e
+    
+    if not probe or 'format' not in probe:
+        return None
+    
+    try:
         format_info = probe['format']
         metadata = {}
         
         # Look for creation date in various metadata fields
-        date_fields = [
-            'creation_time', 'date', 'date_created', 'creation_date',
-            'creation_time_utc', 'date_time', 'date_time_original'
-        ]
-        
-        for field in date_fields:
-            if field in format_info.get('tags', {}):
-                date_str = format_info['tags'][field]
-                try:
-                    # Try different date formats
-                    for fmt in [
-                        "%Y-%m-%d %H:%M:%S",
-                        "%Y-%m-%dT%H:%M:%S.%fZ",
-                        "%Y-%m-%dT%H:%M:%S",
-                        "%Y:%m:%d %H:%M:%S",
-                        "%Y-%m-%d",
-                        "%Y/%m/%d %H:%M:%S"
-                    ]:
-                        try:
-                            metadata['creation_date'] = datetime.strptime(date_str, fmt)
-                            break
-                        except ValueError:
-                            continue
-                    if 'creation_date' in metadata:
-                        break
-                except Exception:
-                    continue
+        creation_date = _creation_date_from_tags(format_info.get('tags', {}))
+        if creation_date is not None:
+            metadata['creation_date'] = creation_date
         
         # Store other useful metadata
         if 'duration' in format_info:
@@ -112,9 +594,111 @@ def get_video_metadata(video_path):
         
         return metadata if metadata else None
         
-    except Exception as e:
-        # Silently fail and return None - will fall back to file system date
-        return None
+    except (AttributeError, TypeError, ValueError) as e:
+        # Malformed ffprobe output
+        raise _ProbeError(e) from e
+
+def _probe_entry(entry, cache):
+    """Fetch metadata for a DirEntry, reusing its cached stat for the cache lookup"""
+    try:
+        stat = entry.stat()
+    except OSError:
+        stat = None
+    return get_video_metadata(entry.path, cache, stat)
+
+def _probe_videos(video_entries, cache=None, jobs=None):
+    """
+    Fetch metadata for many videos concurrently.
+    
+    Each probe mostly waits on an ffprobe subprocess, so a thread pool
+    overlaps them. video_entries is consumed lazily with a bounded number
+    of probes in flight, so a directory walk feeding it keeps running
+    while earlier files are probed. Results are yielded in the order of
+    video_entries.
+    
+    Args:
+        video_entries (iterable): os.DirEntry objects of the video files to probe
+        cache (_MetaCache): Optional on-disk metadata cache
+        jobs (int): Number of worker threads (defaults to DEFAULT_JOBS)
+        
+    Yields:
+        tuple: (Path, metadata) for each video
+    """
+    workers = jobs or DEFAULT_JOBS
+    window = workers * 4
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for entry in video_entries:
+                pending.append((entry, executor.submit(_probe_entry, entry, cache)))
+                if len(pending) >= window:
+                    entry, future = pending.popleft()
+                    yield Path(entry.path), future.result()
+            
+            while pending:
+                entry, future = pending.popleft()
+                yield Path(entry.path), future.result()
+        finally:
+            # Drop queued probes if the caller stops early
+            for _, future in pending:
+                future.cancel()
+
+def in_month_folder(file_path, source_dir):
+    """
+    Check whether a file sits directly in a source_dir/YYYY/MM-Month folder.
+    
+    This only looks at the path, so it is free, but it does not prove the
+    file's creation date matches the folder it is in.
+    
+    Args:
+        file_path (str or Path): Path to the video file
+        source_dir (str or Path): Source directory
+        
+    Returns:
+        bool: True if the path has the organized YYYY/MM-Month shape
+    """
+    year_path, month_dir = os.path.split(os.path.dirname(file_path))
+    parent, year_dir = os.path.split(year_path)
+    if os.path.normpath(parent) != os.path.normpath(source_dir):
+        return False
+    if len(year_dir) != 4 or not year_dir.isdigit():
+        return False
+    
+    return month_dir in _MONTH_DIRS
+
+def stream_videos(source_dir, cache=None, jobs=None, verify=True, on_skip=None, strict_mime=False,
+                  exclude=None):
+    """
+    Walk source_dir and yield each video together with its metadata.
+    
+    Args:
+        source_dir (Path): Directory to scan recursively
+        cache (_MetaCache): Optional on-disk metadata cache
+        jobs (int): Number of concurrent metadata probes (defaults to DEFAULT_JOBS)
+        verify (bool): If False, videos already in a YYYY/MM-Month folder are
+            assumed organized and are neither probed nor yielded
+        on_skip (callable): Called with the path of each video skipped that way
+        strict_mime (bool): If True, also treat files with a video/* MIME type as videos
+        exclude (set): Normalized paths to leave out, such as files the caller has
+            already moved into place while the walk is still running
+        
+    Yields:
+        tuple: (Path, metadata) for each video; metadata is None when unavailable
+    """
+    entries = iter_videos(source_dir, strict_mime)
+    if exclude is not None or not verify:
+        def wanted(entries):
+            for entry in entries:
+                if exclude and os.path.normpath(entry.path) in exclude:
+                    continue
+                if not verify and in_month_folder(entry.path, source_dir):
+                    if on_skip is not None:
+                        on_skip(entry.path)
+                    continue
+                yield entry
+        entries = wanted(entries)
+    
+    yield from _probe_videos(entries, cache, jobs)
 
 def get_file_date(file_path):
     """
@@ -144,26 +728,28 @@ def get_month_name(month_number):
     Returns:
         str: Month name
     """
-    month_names = [
-        "January", "February", "March", "April", "May", "June",
-        "July", "August", "September", "October", "November", "December"
-    ]
-    return month_names[month_number - 1]
+    return _MONTH_NAMES[month_number - 1]
 
-def is_already_organized(file_path, source_dir):
+def is_already_organized(file_path, source_dir, file_date=None):
     """
     Check if a video file is already in the correct organized structure.
     
     Args:
         file_path (Path): Path to the video file
         source_dir (Path): Source directory
+        file_date (datetime): Creation date if already known; probed from metadata otherwise
         
     Returns:
         bool: True if the file is already organized, False otherwise
     """
     try:
         # Get the file's date from metadata
-        file_date = get_file_date(file_path)
+        if file_date is None:
+            # A file outside any YYYY/MM-Month folder can't be organized,
+            # whatever its date - don't probe it just to find that out
+            if not in_month_folder(file_path, source_dir):
+                return False
+            file_date = get_file_date(file_path)
         if file_date is None:
             # No metadata - can't determine if organized
             return False
@@ -171,30 +757,31 @@ def is_already_organized(file_path, source_dir):
         year = file_date.year
         month = file_date.month
         
-        # Create expected organized path
-        month_name = get_month_name(month)
-        expected_dir = source_dir / str(year) / f"{month:02d}-{month_name}"
-        expected_path = expected_dir / file_path.name
-        
-        # Check if the file is already in the expected location
-        return file_path == expected_path
+        # Compare the folder names instead of building the expected path;
+        # the cheap name checks rule out almost every unorganized file
+        parent = file_path.parent
+        return (parent.name == _MONTH_DIRS[month - 1]
+                and parent.parent.name == str(year)
+                and parent.parent.parent == source_dir)
         
     except Exception:
         # If we can't determine the date, assume it's not organized
         return False
 
-def get_expected_path(file_path, source_dir):
+def get_expected_path(file_path, source_dir, file_date=None):
     """
     Get the expected organized path for a video file.
     
     Args:
         file_path (Path): Path to the video file
         source_dir (Path): Source directory
+        file_date (datetime): Creation date if already known; probed from metadata otherwise
         
     Returns:
         Path: Expected organized path
     """
-    file_date = get_file_date(file_path)
+    if file_date is None:
+        file_date = get_file_date(file_path)
     if file_date is None:
         # No metadata - can't determine expected path
         return None
@@ -202,220 +789,370 @@ def get_expected_path(file_path, source_dir):
     year = file_date.year
     month = file_date.month
     
-    month_name = get_month_name(month)
-    expected_dir = source_dir / str(year) / f"{month:02d}-{month_name}"
-    return expected_dir / file_path.name
+    # Join as strings and build a single Path rather than one per '/' step
+    return Path(os.path.join(source_dir, str(year), _MONTH_DIRS[month - 1], file_path.name))
 
-def move_video_file(file_info, dry_run=False):
+def _rename_no_replace(source, target):
+    """
+    Rename a file without ever overwriting the target.
+    
+    Windows' rename already refuses existing targets. POSIX rename
+    overwrites, so a hard link (which fails with EEXIST) is made and the
+    source unlinked instead. Symlinks are linked as links, not followed.
+    
+    Args:
+        source (Path): File to move
+        target (Path): New path on the same filesystem
+        
+    Raises:
+        FileExistsError: If the target already exists
+        OSError: If the paths are on different devices or linking is unsupported
+    """
+    if os.name == 'nt':
+        os.rename(source, target)
+        return
+    
+    if os.link not in os.supports_follow_symlinks:
+        # Linking would duplicate a symlink's target instead of the link itself
+        raise OSError(f"cannot hard-link symlinks here: {source}")
+    os.link(source, target, follow_symlinks=False)
+    try:
+        os.unlink(source)
+    except OSError:
+        os.unlink(target)
+        raise
+
+def move_video_file(file_info, dry_run=False, created_dirs=None):
     """
     Move a video file to its organized location.
     
     Args:
-        file_info (dict): Dictionary containing file information
+        file_info (VideoFileInfo): The video and its target path
         dry_run (bool): If True, only print what would be done without actually moving
+        created_dirs (set): Directories already created in this run; mkdir is
+            skipped for these and new ones are added
         
     Returns:
         bool: True if successful, False otherwise
     """
-    source = file_info['source']
-    target = file_info['target']
+    source = file_info.source
+    target = file_info.target
     
     if dry_run:
-        print(f"  [DRY RUN] Would move: {source.name}")
-        print(f"    From: {source}")
-        print(f"    To:   {target}")
+        sys.stdout.write(f"  [DRY RUN] Would move: {source.name}\n"
+                         f"    From: {source}\n"
+                         f"    To:   {target}\n")
         return True
     
     try:
         # Create the target directory if it doesn't exist
-        target.parent.mkdir(parents=True, exist_ok=True)
+        if created_dirs is None or target.parent not in created_dirs:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if created_dirs is not None:
+                created_dirs.add(target.parent)
         
-        # Check if target file already exists
-        if target.exists():
-            print(f"  [WARNING] Target file already exists: {target}")
-            print(f"    Skipping: {source.name}")
+        try:
+            # Same filesystem: the rename itself reports an existing target,
+            # so there is no separate exists() or st_dev check
+            _rename_no_replace(source, target)
+        except FileExistsError:
+            sys.stdout.write(f"  [WARNING] Target file already exists: {target}\n"
+                             f"    Skipping: {source.name}\n")
             return False
-        
-        # Move the file
-        shutil.move(str(source), str(target))
-        print(f"  [MOVED] {source.name}")
-        print(f"    From: {source}")
-        print(f"    To:   {target}")
+        except OSError:
+            # Different device (or no hard links here): shutil copies + unlinks
+            if target.exists():
+                sys.stdout.write(f"  [WARNING] Target file already exists: {target}\n"
+                                 f"    Skipping: {source.name}\n")
+                return False
+            shutil.move(str(source), str(target))
+        sys.stdout.write(f"  [MOVED] {source.name}\n"
+                         f"    From: {source}\n"
+                         f"    To:   {target}\n")
         return True
         
     except Exception as e:
         print(f"  [ERROR] Failed to move {source.name}: {e}")
         return False
 
-def scan_and_organize_videos(source_dir, move_files=False, dry_run=False):
+def move_videos(file_infos, dry_run=False, created_dirs=None, jobs=None, cancel_event=None):
+    """
+    Move a group of videos that share a target folder concurrently.
+    
+    The folder is created once up front, so the worker threads never race
+    on mkdir; cross-device moves (byte copies) then overlap on the pool.
+    Files bound for the same target name (e.g. VID_0001.mp4 from two
+    cards) are moved one after another by a single worker, so the
+    "target already exists" check can't race and overwrite a file. A dry
+    run does no I/O, so it runs sequentially and prints in a stable order.
+    
+    Args:
+        file_infos (list): VideoFileInfo entries with the same target folder
+        dry_run (bool): If True, only print what would be done without actually moving
+        created_dirs (set): Directories already created in this run
+        jobs (int): Number of concurrent moves (capped at MAX_MOVE_JOBS)
+        cancel_event (threading.Event): Optional event; moves not yet started are skipped once set
+        
+    Returns:
+        tuple: (moved_count, failed_count); skipped moves are not counted
+    """
+    if not file_infos:
+        return 0, 0
+    if created_dirs is None:
+        created_dirs = set()
+    
+    target_dir = file_infos[0].target.parent
+    if not dry_run and target_dir not in created_dirs:
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(target_dir)
+        except OSError:
+            # Let each move report the failure
+            pass
+    
+    # Same-named files share a chain that one worker runs in order
+    chains = defaultdict(list)
+    for file_info in file_infos:
+        chains[file_info.target].append(file_info)
+    
+    def move_chain(chain):
+        results = []
+        for file_info in chain:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            results.append(move_video_file(file_info, dry_run, created_dirs))
+        return results
+    
+    if dry_run:
+        # Nothing to overlap; run in order so the report is deterministic
+        results = [result for chain in chains.values() for result in move_chain(chain)]
+    else:
+        workers = min(jobs or MAX_MOVE_JOBS, MAX_MOVE_JOBS, len(chains))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = [result for chain_results in executor.map(move_chain, chains.values())
+                       for result in chain_results]
+    
+    moved_count = results.count(True)
+    return moved_count, results.count(False)
+
+def format_video_info(file_info):
+    """
+    Format the report block for an unorganized video.
+    
+    Args:
+        file_info (VideoFileInfo): The video and its target path
+        
+    Returns:
+        str: Lines describing where the video is and where it belongs,
+            ending with a blank line
+    """
+    source = file_info.source
+    
+    lines = [
+        f"    {source.name}",
+        f"      From: {source}",
+        f"      To:   {file_info.target}",
+        f"      Date: {file_info.date.strftime('%Y-%m-%d %H:%M:%S')} (Metadata)",
+    ]
+    
+    # Print additional metadata if available
+    if file_info.duration is not None:
+        duration_min = file_info.duration / 60
+        lines.append(f"      Duration: {duration_min:.1f} minutes")
+    if file_info.size is not None:
+        size_mb = file_info.size / (1024 * 1024)
+        lines.append(f"      Size: {size_mb:.1f} MB")
+    
+    lines.append("\n")
+    return "\n".join(lines)
+
+def scan_and_organize_videos(source_dir, move_files=False, dry_run=False, jobs=None, group=False,
+                             verify=True, strict_mime=False, log=None, cancel_event=None,
+                             move_hint="Use --move to actually move the files, or --dry-run to see what would be moved."):
     """
     Scan the source directory recursively for videos and organize them.
     
+    Each unorganized video is printed or moved as soon as its metadata is
+    known, so only counters are kept in memory. With group=True the
+    unorganized videos are collected first and reported by year and month.
+    
     Args:
         source_dir (Path): Source directory to scan
         move_files (bool): If True, actually move the files to organized locations
         dry_run (bool): If True, only print what would be done without actually moving
+        jobs (int): Number of concurrent metadata probes (defaults to DEFAULT_JOBS)
+        group (bool): If True, collect the results and report them grouped by month
+        verify (bool): If False, videos already in a YYYY/MM-Month folder are
+            counted as organized without probing their metadata
+        strict_mime (bool): If True, also treat files with a video/* MIME type as videos
+        log (callable): Optional func(message, level) receiving the report one
+            line at a time; by default it is written to stdout
+        cancel_event (threading.Event): Optional event that stops the run between files when set
+        move_hint (str): Closing hint shown in check mode when videos need moving
     """
-    if not source_dir.exists():
-        print(f"Error: Directory '{source_dir}' does not exist.")
+    if log is None:
+        def out(text, level="INFO"):
+            sys.stdout.write(text + "\n")
+    else:
+        def out(text, level="INFO"):
+            for line in text.split("\n"):
+                log(line, level)
+    
+    def cancelled():
+        if cancel_event is not None and cancel_event.is_set():
+            out("Video organization cancelled", "WARNING")
+            return True
+        return False
+    
+    # One stat answers both "exists" and "is a directory"
+    try:
+        is_dir = S_ISDIR(os.stat(source_dir).st_mode)
+    except OSError:
+        out(f"Error: Directory '{source_dir}' does not exist.", "ERROR")
         return
     
-    if not source_dir.is_dir():
-        print(f"Error: '{source_dir}' is not a directory.")
+    if not is_dir:
+        out(f"Error: '{source_dir}' is not a directory.", "ERROR")
         return
     
-    print(f"Scanning directory: {source_dir}")
+    out(f"Scanning directory: {source_dir}")
     if move_files:
         if dry_run:
-            print("Mode: DRY RUN - Will show what would be moved without actually moving files")
+            out("Mode: DRY RUN - Will show what would be moved without actually moving files")
         else:
-            print("Mode: MOVE FILES - Will actually move files to organized locations")
+            out("Mode: MOVE FILES - Will actually move files to organized locations")
     else:
-        print("Mode: CHECK ONLY - Will only show what needs to be organized")
-    print("=" * 60)
+        out("Mode: CHECK ONLY - Will only show what needs to be organized")
+    out("=" * 60)
     
     video_count = 0
-    unorganized_files = []
+    skipped_count = 0
     metadata_count = 0
     no_metadata_count = 0
+    unorganized_count = 0
+    moved_count = 0
+    failed_count = 0
+    created_dirs = set()
+    organized_by_date = defaultdict(list)
+    
+    def on_skip(path):
+        nonlocal skipped_count
+        skipped_count += 1
     
     # Recursively scan for videos
-    print("Scanning for videos... (Press Ctrl+C to stop)")
-    scanned_files = 0
+    out("Scanning for videos... (Press Ctrl+C to stop)")
     
-    for file_path in source_dir.rglob('*'):
-        scanned_files += 1
-        
-        # Show progress every 100 files
-        if scanned_files % 100 == 0:
-            print(f"  Scanned {scanned_files} files, found {video_count} videos...")
-        
-        if file_path.is_file() and is_video_file(file_path):
+    with _MetaCache(log=out) as cache:
+        # The walk is lazy and overlaps the moves below, so it must not pick
+        # up (and count or probe again) files this run has just moved
+        moved_paths = set()
+        for file_path, metadata in stream_videos(source_dir, cache, jobs, verify, on_skip, strict_mime,
+                                                 moved_paths):
+            if cancelled():
+                return
+            
             video_count += 1
             
-            # Check if video has metadata
-            metadata = get_video_metadata(file_path)
+            # Show progress every 100 videos
+            if video_count % 100 == 0:
+                out(f"  Processed {video_count} videos...")
             
-            if metadata and 'creation_date' in metadata:
-                metadata_count += 1
-                date_source = "Metadata"
-                
-                # Check if the file is already organized
-                if not is_already_organized(file_path, source_dir):
-                    # Get the expected organized path
-                    expected_path = get_expected_path(file_path, source_dir)
-                    file_date = get_file_date(file_path)
-                    
-                    unorganized_files.append({
-                        'source': file_path,
-                        'target': expected_path,
-                        'date': file_date,
-                        'date_source': date_source,
-                        'metadata': metadata
-                    })
-            else:
+            if not metadata or 'creation_date' not in metadata:
+                # Skip files without metadata
                 no_metadata_count += 1
-                # Skip files without metadata - don't add to unorganized_files
-    
-    print(f"Found {video_count} video files")
-    print(f"  - {metadata_count} with metadata creation dates")
-    print(f"  - {no_metadata_count} without metadata (skipped)")
-    print("=" * 60)
+                continue
+            
+            metadata_count += 1
+            file_date = metadata['creation_date']
+            
+            # Check if the file is already organized
+            if is_already_organized(file_path, source_dir, file_date):
+                continue
+            expected_path = get_expected_path(file_path, source_dir, file_date)
+            
+            # Keep only the fields the report needs, not the whole metadata dict
+            file_info = VideoFileInfo(file_path, expected_path, file_date,
+                                      metadata.get('duration'), metadata.get('size'))
+            unorganized_count += 1
+            
+            if group:
+                organized_by_date[(file_date.year, file_date.month)].append(file_info)
+                continue
+            
+            if unorganized_count == 1:
+                out("UNORGANIZED VIDEOS:")
+                out("=" * 60)
+            if not move_files:
+                # format_video_info ends with a newline that out() adds back
+                out(format_video_info(file_info)[:-1])
+            elif move_video_file(file_info, dry_run, created_dirs):
+                moved_count += 1
+                if not dry_run:
+                    moved_paths.add(os.path.normpath(file_info.target))
+            else:
+                failed_count += 1
     
-    if video_count == 0:
-        print("No video files found in the specified directory.")
+    if video_count + skipped_count == 0:
+        out("No video files found in the specified directory.")
         return
     
-    # Print unorganized files
-    if unorganized_files:
-        print(f"UNORGANIZED VIDEOS:")
-        print("=" * 60)
-        
-        # Group by year and month
-        organized_by_date = {}
-        for file_info in unorganized_files:
-            year = file_info['date'].year
-            month = file_info['date'].month
-            key = (year, month)
-            
-            if key not in organized_by_date:
-                organized_by_date[key] = []
-            organized_by_date[key].append(file_info)
-        
-        moved_count = 0
-        failed_count = 0
+    # Print unorganized files grouped by year and month
+    if organized_by_date:
+        out("=" * 60)
+        out("UNORGANIZED VIDEOS:")
+        out("=" * 60)
         
         for (year, month) in sorted(organized_by_date.keys()):
-            month_name = get_month_name(month)
-            print(f"\n{year}")
-            print(f"  {month:02d}-{month_name}/")
+            if cancelled():
+                return
+            
+            header = f"\n{year}\n  {_MONTH_DIRS[month - 1]}/"
             
-            for file_info in organized_by_date[(year, month)]:
-                source = file_info['source']
-                target = file_info['target']
-                date = file_info['date']
-                date_source = file_info['date_source']
-                metadata = file_info['metadata']
-                
-                if not move_files:
-                    # Just print the information
-                    print(f"    {source.name}")
-                    print(f"      From: {source}")
-                    print(f"      To:   {target}")
-                    print(f"      Date: {date.strftime('%Y-%m-%d %H:%M:%S')} ({date_source})")
-                    
-                    # Print additional metadata if available
-                    if metadata:
-                        if 'duration' in metadata:
-                            duration_min = metadata['duration'] / 60
-                            print(f"      Duration: {duration_min:.1f} minutes")
-                        if 'size' in metadata:
-                            size_mb = metadata['size'] / (1024 * 1024)
-                            print(f"      Size: {size_mb:.1f} MB")
-                    
-                    print()
-                else:
-                    # Move the file
-                    if move_video_file(file_info, dry_run):
-                        moved_count += 1
-                    else:
-                        failed_count += 1
-        
-        print("=" * 60)
-        print(f"SUMMARY:")
-        print(f"  Total videos found: {video_count}")
-        print(f"  Videos with metadata: {metadata_count}")
-        print(f"  Videos without metadata (skipped): {no_metadata_count}")
-        print(f"  Unorganized videos: {len(unorganized_files)}")
+            if move_files:
+                out(header)
+                moved, failed = move_videos(organized_by_date[(year, month)], dry_run,
+                                            created_dirs, jobs, cancel_event)
+                moved_count += moved
+                failed_count += failed
+            else:
+                # Report the whole group at once
+                out(header + "\n" + "".join(
+                    format_video_info(file_info) for file_info in organized_by_date[(year, month)]
+                )[:-1])
+            sys.stdout.flush()
         
+        if cancelled():
+            return
+    
+    out("=" * 60)
+    out("SUMMARY:")
+    out(f"  Total videos found: {video_count + skipped_count}")
+    if not verify:
+        out(f"  Already in YYYY/MM-Month folders (not probed, use --verify to check): {skipped_count}")
+    out(f"  Videos with metadata: {metadata_count}")
+    out(f"  Videos without metadata (skipped): {no_metadata_count}")
+    out(f"  Unorganized videos: {unorganized_count}")
+    
+    if unorganized_count:
         if move_files:
             if dry_run:
-                print(f"  Files that would be moved: {moved_count}")
-                print(f"  Files that would fail: {failed_count}")
+                out(f"  Files that would be moved: {moved_count}")
+                out(f"  Files that would fail: {failed_count}")
             else:
-                print(f"  Files successfully moved: {moved_count}")
-                print(f"  Files that failed to move: {failed_count}")
-        
-        if not move_files:
-            print()
-            print("These videos need to be moved to their proper organized locations.")
-            print("Use --move to actually move the files, or --dry-run to see what would be moved.")
-        
+                out(f"  Files successfully moved: {moved_count}")
+                out(f"  Files that failed to move: {failed_count}")
+        else:
+            out("")
+            out("These videos need to be moved to their proper organized locations.")
+            out(move_hint)
     else:
-        print("All videos are already properly organized!")
-        print("=" * 60)
-        print(f"SUMMARY:")
-        print(f"  Total videos found: {video_count}")
-        print(f"  Videos with metadata: {metadata_count}")
-        print(f"  Videos without metadata (skipped): {no_metadata_count}")
-        print(f"  Unorganized videos: 0")
-        print()
-        print("✓ All videos are already in the correct organized structure!")
+        out("")
+        out("✓ All videos are already in the correct organized structure!", "SUCCESS")
 
 class VideoOrganizer:
     """Class wrapper for video organization functionality"""
     
-    def __init__(self, directory, mode="check", log_callback=None):
+    def __init__(self, directory, mode="check", log_callback=None, cancel_event=None, jobs=None):
         """
         Initialize the VideoOrganizer
         
@@ -423,10 +1160,14 @@ class VideoOrganizer:
             directory (str): Path to the directory containing videos to organize
             mode (str): Operation mode - "check", "dry_run", or "move"
             log_callback (callable): Optional callback function for logging (func(message, level))
+            cancel_event (threading.Event): Optional event that stops the run between files when set
+            jobs (int): Number of concurrent metadata probes (defaults to DEFAULT_JOBS)
         """
         self.directory = Path(directory)
         self.mode = mode
         self.log_callback = log_callback or self._default_log
+        self.cancel_event = cancel_event
+        self.jobs = jobs
     
     def _default_log(self, message, level="INFO"):
         """Default logging function that prints to console"""
@@ -434,10 +1175,12 @@ class VideoOrganizer:
     
     def organize_videos(self):
         """Organize videos based on the specified mode"""
-        if not self.directory.exists():
+        try:
+            is_dir = S_ISDIR(os.stat(self.directory).st_mode)
+        except OSError:
             raise FileNotFoundError(f"Directory '{self.directory}' does not exist.")
         
-        if not self.directory.is_dir():
+        if not is_dir:
             raise NotADirectoryError(f"'{self.directory}' is not a directory.")
         
         if self.mode == "check":
@@ -460,153 +1203,22 @@ class VideoOrganizer:
             move_files (bool): If True, actually move the files to organized locations
             dry_run (bool): If True, only print what would be done without actually moving
         """
-        self.log_callback(f"Scanning directory: {self.directory}", "INFO")
-        if move_files:
-            if dry_run:
-                self.log_callback("Mode: DRY RUN - Will show what would be moved without actually moving files", "INFO")
-            else:
-                self.log_callback("Mode: MOVE FILES - Will actually move files to organized locations", "INFO")
-        else:
-            self.log_callback("Mode: CHECK ONLY - Will only show what needs to be organized", "INFO")
-        self.log_callback("=" * 60, "INFO")
-        
-        video_count = 0
-        unorganized_files = []
-        metadata_count = 0
-        no_metadata_count = 0
-        
-        # Recursively scan for videos
-        self.log_callback("Scanning for videos... (Press Ctrl+C to stop)", "INFO")
-        scanned_files = 0
-        
-        for file_path in self.directory.rglob('*'):
-            scanned_files += 1
-            
-            # Show progress every 100 files
-            if scanned_files % 100 == 0:
-                self.log_callback(f"  Scanned {scanned_files} files, found {video_count} videos...", "INFO")
-            
-            if file_path.is_file() and is_video_file(file_path):
-                video_count += 1
-                
-                # Check if video has metadata
-                metadata = get_video_metadata(file_path)
-                
-                if metadata and 'creation_date' in metadata:
-                    metadata_count += 1
-                    date_source = "Metadata"
-                    
-                    # Check if the file is already organized
-                    if not is_already_organized(file_path, self.directory):
-                        # Get the expected organized path
-                        expected_path = get_expected_path(file_path, self.directory)
-                        file_date = get_file_date(file_path)
-                        
-                        unorganized_files.append({
-                            'source': file_path,
-                            'target': expected_path,
-                            'date': file_date,
-                            'date_source': date_source,
-                            'metadata': metadata
-                        })
-                else:
-                    no_metadata_count += 1
-                    # Skip files without metadata - don't add to unorganized_files
-        
-        self.log_callback(f"Found {video_count} video files", "INFO")
-        self.log_callback(f"  - {metadata_count} with metadata creation dates", "INFO")
-        self.log_callback(f"  - {no_metadata_count} without metadata (skipped)", "INFO")
-        self.log_callback("=" * 60, "INFO")
-        
-        if video_count == 0:
-            self.log_callback("No video files found in the specified directory.", "INFO")
-            return
-        
-        # Print unorganized files
-        if unorganized_files:
-            self.log_callback(f"UNORGANIZED VIDEOS:", "INFO")
-            self.log_callback("=" * 60, "INFO")
-            
-            # Group by year and month
-            organized_by_date = {}
-            for file_info in unorganized_files:
-                year = file_info['date'].year
-                month = file_info['date'].month
-                key = (year, month)
-                
-                if key not in organized_by_date:
-                    organized_by_date[key] = []
-                organized_by_date[key].append(file_info)
-            
-            moved_count = 0
-            failed_count = 0
-            
-            for (year, month) in sorted(organized_by_date.keys()):
-                month_name = get_month_name(month)
-                self.log_callback(f"\n{year}", "INFO")
-                self.log_callback(f"  {month:02d}-{month_name}/", "INFO")
-                
-                for file_info in organized_by_date[(year, month)]:
-                    source = file_info['source']
-                    target = file_info['target']
-                    date = file_info['date']
-                    date_source = file_info['date_source']
-                    metadata = file_info['metadata']
-                    
-                    if not move_files:
-                        # Just print the information
-                        self.log_callback(f"    {source.name}", "INFO")
-                        self.log_callback(f"      From: {source}", "INFO")
-                        self.log_callback(f"      To:   {target}", "INFO")
-                        self.log_callback(f"      Date: {date.strftime('%Y-%m-%d %H:%M:%S')} ({date_source})", "INFO")
-                        
-                        # Print additional metadata if available
-                        if metadata:
-                            if 'duration' in metadata:
-                                duration_min = metadata['duration'] / 60
-                                self.log_callback(f"      Duration: {duration_min:.1f} minutes", "INFO")
-                            if 'size' in metadata:
-                                size_mb = metadata['size'] / (1024 * 1024)
-                                self.log_callback(f"      Size: {size_mb:.1f} MB", "INFO")
-                        
-                        self.log_callback("", "INFO")
-                    else:
-                        # Move the file
-                        if move_video_file(file_info, dry_run):
-                            moved_count += 1
-                        else:
-                            failed_count += 1
-            
-            self.log_callback("=" * 60, "INFO")
-            self.log_callback(f"SUMMARY:", "INFO")
-            self.log_callback(f"  Total videos found: {video_count}", "INFO")
-            self.log_callback(f"  Videos with metadata: {metadata_count}", "INFO")
-            self.log_callback(f"  Videos without metadata (skipped): {no_metadata_count}", "INFO")
-            self.log_callback(f"  Unorganized videos: {len(unorganized_files)}", "INFO")
-            
-            if move_files:
-                if dry_run:
-                    self.log_callback(f"  Files that would be moved: {moved_count}", "INFO")
-                    self.log_callback(f"  Files that would fail: {failed_count}", "INFO")
-                else:
-                    self.log_callback(f"  Files successfully moved: {moved_count}", "INFO")
-                    self.log_callback(f"  Files that failed to move: {failed_count}", "INFO")
-            
-            if not move_files:
-                self.log_callback("", "INFO")
-                self.log_callback("These videos need to be moved to their proper organized locations.", "INFO")
-                self.log_callback("Use 'move' mode to actually move the files, or 'dry_run' mode to see what would be moved.", "INFO")
-            
-        else:
-            self.log_callback("All videos are already properly organized!", "INFO")
-            self.log_callback("=" * 60, "INFO")
-            self.log_callback(f"SUMMARY:", "INFO")
-            self.log_callback(f"  Total videos found: {video_count}", "INFO")
-            self.log_callback(f"  Videos with metadata: {metadata_count}", "INFO")
-            self.log_callback(f"  Videos without metadata (skipped): {no_metadata_count}", "INFO")
-            self.log_callback(f"  Unorganized videos: 0", "INFO")
-            self.log_callback("", "INFO")
-            self.log_callback("✓ All videos are already in the correct organized structure!", "SUCCESS")
+        scan_and_organize_videos(
+            self.directory, move_files=move_files, dry_run=dry_run, jobs=self.jobs,
+            group=True, log=self.log_callback, cancel_event=self.cancel_event,
+            move_hint="Use 'move' mode to actually move the files, or 'dry_run' mode to see what would be moved."
+        )
+
+
+def _positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -619,9 +1231,12 @@ Examples:
   python video_organizer.py /path/to/videos                    # Check only
   python video_organizer.py /path/to/videos --dry-run          # Show what would be moved
   python video_organizer.py /path/to/videos --move             # Actually move files
+  python video_organizer.py /path/to/videos --group            # Report grouped by month
+  python video_organizer.py /path/to/videos --verify           # Also re-check organized folders
   python video_organizer.py "C:\\Users\\Username\\Videos" --move
 
-Note: Install ffmpeg-python for metadata support: pip install ffmpeg-python
+Note: Metadata is read with ffprobe, which ships with FFmpeg
+      (or PyAV to probe in-process without spawning ffprobe: pip install av)
         """
     )
     
@@ -642,6 +1257,31 @@ Note: Install ffmpeg-python for metadata support: pip install ffmpeg-python
         help='Show what would be moved without actually moving files'
     )
     
+    parser.add_argument(
+        '--jobs',
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help=f'Number of videos to probe for metadata concurrently (default: {DEFAULT_JOBS})'
+    )
+    
+    parser.add_argument(
+        '--group',
+        action='store_true',
+        help='Collect results and report them grouped by year and month instead of streaming'
+    )
+    
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Also probe videos already in YYYY/MM-Month folders to confirm they are in the right month'
+    )
+    
+    parser.add_argument(
+        '--strict-mime',
+        action='store_true',
+        help='Also detect videos with unrecognised extensions by MIME type (slower)'
+    )
+    
     args = parser.parse_args()
     
     # Convert to Path object
@@ -649,7 +1289,9 @@ Note: Install ffmpeg-python for metadata support: pip install ffmpeg-python
     
     try:
         # Execute the scan
-        scan_and_organize_videos(source_dir, move_files=args.move, dry_run=args.dry_run)
+        scan_and_organize_videos(source_dir, move_files=args.move, dry_run=args.dry_run,
+                                 jobs=args.jobs, group=args.group, verify=args.verify,
+                                 strict_mime=args.strict_mime)
     except KeyboardInterrupt:
         print("\n\nScript interrupted by user (Ctrl+C)")
         print("Partial results may have been displayed above.")
@@ -35,6 +35,7 @@ import sys
 import argparse
 import re
 import time
+import threading
 from pathlib import Path
 from pydub import AudioSegment
 from pydub.utils import which
@@ -919,13 +920,16 @@ class EnhancedWAVToFLACConverter:
     
     def __init__(self, source_path: str, output_folder: str = "FLAC CONVERTER 2", 
                  compatibility_mode: bool = False, enable_metadata: bool = True,
-                 aggressive_metadata: bool = False, enable_fingerprinting: bool = True):
+                 aggressive_metadata: bool = False, enable_fingerprinting: bool = True,
+                 cancel_event: Optional[threading.Event] = None):
         self.source_path = Path(source_path)
         self.output_folder = output_folder
         self.compatibility_mode = compatibility_mode
         self.enable_metadata = enable_metadata
         self.aggressive_metadata = aggressive_metadata
         self.enable_fingerprinting = enable_fingerprinting
+        # Set by the caller to stop convert_all between files
+        self.cancel_event = cancel_event
         
         # Verify source path exists
         if not self.source_path.exists():
@@ -1188,6 +1192,10 @@ class EnhancedWAVToFLACConverter:
         logger.info("=" * 80)
         
         for i, audio_file in enumerate(audio_files, 1):
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                logger.warning(f"Conversion cancelled after {i - 1} of {len(audio_files)} files")
+                break
+            
             logger.info(f"\n[{i}/{len(audio_files)}] Processing file {i} of {len(audio_files)}")
             
             if self.process_single_file(audio_file):